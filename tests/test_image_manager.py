@@ -0,0 +1,139 @@
+"""Tests for ImageManager file operations.
+
+Usage:
+    python -m pytest tests/test_image_manager.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "utils"))
+
+from image_manager import ImageManager  # noqa: E402
+
+WATCH_ID = "PATEK_nab_001"
+
+
+def _make_watch(root, *filenames):
+    """Create a watch folder under root containing the given (dummy) images."""
+    watch_dir = root / WATCH_ID
+    watch_dir.mkdir(exist_ok=True)
+    for name in filenames:
+        (watch_dir / name).write_bytes(name.encode())
+    return watch_dir
+
+
+def _image(manager, filename):
+    """Find a loaded image by filename."""
+    for img in manager.load_images(WATCH_ID):
+        if img.filename == filename:
+            return img
+    raise AssertionError(f"{filename} not loaded")
+
+
+def test_delete_adds_suffix_for_repeated_names(tmp_path):
+    """Deleting the same filename again goes to _1, then _2 in trash."""
+    manager = ImageManager(str(tmp_path))
+    name = "PATEK_nab_001_01_face.jpg"
+
+    for _ in range(3):
+        _make_watch(tmp_path, name)
+        success, message = manager.delete_image(_image(manager, name))
+        assert success, message
+
+    trash_dir = tmp_path / ".trash" / WATCH_ID
+    assert sorted(os.listdir(trash_dir)) == [
+        "PATEK_nab_001_01_face.jpg",
+        "PATEK_nab_001_01_face_1.jpg",
+        "PATEK_nab_001_01_face_2.jpg",
+    ]
+    assert os.listdir(tmp_path / WATCH_ID) == []
+
+
+def test_rename_refuses_to_overwrite(tmp_path):
+    """rename_image must fail rather than replace an existing file."""
+    watch_dir = _make_watch(
+        tmp_path, "PATEK_nab_001_01_face.jpg", "PATEK_nab_001_01_tiltface.jpg"
+    )
+    manager = ImageManager(str(tmp_path))
+
+    success, message = manager.rename_image(
+        _image(manager, "PATEK_nab_001_01_face.jpg"), "tiltface", None
+    )
+
+    assert not success, message
+    assert message == "Target file already exists: PATEK_nab_001_01_tiltface.jpg"
+    assert (watch_dir / "PATEK_nab_001_01_face.jpg").read_bytes() == b"PATEK_nab_001_01_face.jpg"
+    assert (watch_dir / "PATEK_nab_001_01_tiltface.jpg").read_bytes() == b"PATEK_nab_001_01_tiltface.jpg"
+
+
+def test_restore_refuses_to_overwrite(tmp_path):
+    """restore_image must fail rather than replace a file put back since."""
+    name = "PATEK_nab_001_01_face.jpg"
+    watch_dir = _make_watch(tmp_path, name)
+    manager = ImageManager(str(tmp_path))
+    success, message = manager.delete_image(_image(manager, name))
+    assert success, message
+
+    (watch_dir / name).write_bytes(b"new")
+    trashed, _ = manager.load_trash_images()[WATCH_ID][0]
+    success, message = manager.restore_image(trashed)
+
+    assert not success, message
+    assert message == f"File already exists at destination: {name}"
+    assert (watch_dir / name).read_bytes() == b"new"
+    assert os.listdir(tmp_path / ".trash" / WATCH_ID) == [name]
+
+
+def test_moves_fall_back_when_hard_links_are_refused(tmp_path, monkeypatch):
+    """Without os.link (e.g. fs.protected_hardlinks) files still move, no-clobber."""
+    watch_dir = _make_watch(
+        tmp_path, "PATEK_nab_001_01_face.jpg", "PATEK_nab_001_02_face.jpg",
+        "PATEK_nab_001_02_tiltface.jpg"
+    )
+    manager = ImageManager(str(tmp_path))
+
+    def refused_link(src, dst, *args, **kwargs):
+        raise PermissionError(1, "Operation not permitted", src)
+
+    monkeypatch.setattr(os, "link", refused_link)
+
+    success, message = manager.rename_image(
+        _image(manager, "PATEK_nab_001_01_face.jpg"), "tiltface", 3
+    )
+    assert success, message
+    assert not (watch_dir / "PATEK_nab_001_01_face.jpg").exists()
+    assert (watch_dir / "PATEK_nab_001_01_tiltface_q3.jpg").read_bytes() == b"PATEK_nab_001_01_face.jpg"
+
+    success, message = manager.rename_image(
+        _image(manager, "PATEK_nab_001_02_face.jpg"), "tiltface", None
+    )
+    assert not success, message
+    assert message == "Target file already exists: PATEK_nab_001_02_tiltface.jpg"
+    assert (watch_dir / "PATEK_nab_001_02_face.jpg").read_bytes() == b"PATEK_nab_001_02_face.jpg"
+    assert (watch_dir / "PATEK_nab_001_02_tiltface.jpg").read_bytes() == b"PATEK_nab_001_02_tiltface.jpg"
+
+
+def test_rename_rolls_back_when_source_unlink_fails(tmp_path, monkeypatch):
+    """A failed unlink after os.link must not leave the image under both names."""
+    watch_dir = _make_watch(tmp_path, "PATEK_nab_001_01_face.jpg")
+    manager = ImageManager(str(tmp_path))
+    image = _image(manager, "PATEK_nab_001_01_face.jpg")
+
+    real_unlink = os.unlink
+
+    def failing_unlink(path, *args, **kwargs):
+        if os.fspath(path) == image.full_path:
+            raise PermissionError(13, "Permission denied", path)
+        return real_unlink(path, *args, **kwargs)
+
+    monkeypatch.setattr(os, "unlink", failing_unlink)
+    success, message = manager.rename_image(image, "tiltface", 2)
+    monkeypatch.setattr(os, "unlink", real_unlink)
+
+    assert not success, f"Rename should fail: {message}"
+    assert message.startswith("Failed to rename:"), message
+    assert sorted(os.listdir(watch_dir)) == ["PATEK_nab_001_01_face.jpg"]
+
+    images = manager.load_images(WATCH_ID)
+    assert [img.filename for img in images] == ["PATEK_nab_001_01_face.jpg"]
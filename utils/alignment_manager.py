@@ -5,9 +5,11 @@ Annotations are stored in JSON files per watch with normalized coordinates.
 Keys use quality-agnostic image IDs (e.g., "PATEK_nab_041_05" instead of full filenames).
 """
 
+import copy
 import os
 import json
-from typing import List, Optional, Tuple, Dict
+import stat
+from typing import List, Optional, Set, Tuple, Dict
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -17,6 +19,80 @@ except ImportError:
     from filename_parser import ImageMetadata, get_image_id
 
 
+# Keypoints every complete annotation must contain
+REQUIRED_KEYPOINTS = ("top", "left", "right", "bottom", "center")
+
+
+def write_json_atomic(path: str, data) -> None:
+    """Write JSON to a file atomically.
+
+    The data is written to a temporary file in the same directory and then
+    moved over the target with os.replace, so readers never see a partially
+    written file. The target keeps its existing permissions; a new file gets
+    the same mode open(path, 'w') would give it (0o666 minus the umask).
+
+    Args:
+        path: Destination file path
+        data: JSON-serializable data
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    directory, name = os.path.split(path)
+    while True:
+        tmp_path = os.path.join(directory, f".{name}.{os.urandom(4).hex()}.tmp")
+        try:
+            # Created 0o666 so the kernel applies the umask, as open(path, 'w')
+            # would. Reading the umask via os.umask() would briefly change it
+            # for every thread in the process.
+            fd = os.open(tmp_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def has_all_keypoints(annotation: Optional[dict]) -> bool:
+    """Check if an annotation entry has all 5 keypoints with 2 coordinates each.
+
+    Args:
+        annotation: Annotation entry (may be None)
+
+    Returns:
+        True if the annotation is complete, False otherwise
+    """
+    if not annotation or "coords_norm" not in annotation:
+        return False
+
+    coords = annotation["coords_norm"]
+
+    return all(
+        key in coords and
+        isinstance(coords[key], list) and
+        len(coords[key]) == 2
+        for key in REQUIRED_KEYPOINTS
+    )
+
+
 class AlignmentManager:
     """Manages alignment annotations for watch images."""
 
@@ -34,6 +110,12 @@ class AlignmentManager:
 
         self.labels_dir = labels_dir
 
+        # Annotation files per watch, keyed by watch_id:
+        # ((mtime_ns, size, inode), raw JSON bytes, parsed dict or None)
+        self._annotations_cache: Dict[
+            str, Tuple[Tuple[int, int, int], bytes, Optional[dict]]
+        ] = {}
+
         # Create directory if it doesn't exist
         os.makedirs(self.labels_dir, exist_ok=True)
 
@@ -57,19 +139,81 @@ class AlignmentManager:
         Returns:
             Dictionary of annotations keyed by filename, or empty dict if not found
         """
-        json_path = self._get_json_path(watch_id)
+        raw = self._load_raw_annotations(watch_id)
+        if raw is None:
+            return {}
 
-        if not os.path.exists(json_path):
+        # Callers may edit the result before saving, so decode a fresh dict
+        # from the cached bytes; deep-copying the shared dict costs more
+        # than parsing it again
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"Error loading annotations for {watch_id}: {e}")
             return {}
 
+    def _load_raw_annotations(self, watch_id: str) -> Optional[bytes]:
+        """Read a watch's JSON file, reusing the cached bytes if unchanged.
+
+        The file is only re-read when its mtime, size or inode changes. Size
+        and inode catch rewrites within one timestamp tick on filesystems with
+        coarse mtimes (write_json_atomic gives every write a new inode).
+
+        Args:
+            watch_id: Watch folder name
+
+        Returns:
+            Raw file contents, or None if the file is missing or unreadable
+        """
+        json_path = self._get_json_path(watch_id)
+
         try:
-            with open(json_path, 'r') as f:
-                annotations = json.load(f)
-            return annotations
-        except (json.JSONDecodeError, IOError) as e:
+            st = os.stat(json_path)
+        except OSError:
+            self._annotations_cache.pop(watch_id, None)
+            return None
+
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._annotations_cache.get(watch_id)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            with open(json_path, 'rb') as f:
+                raw = f.read()
+        except IOError as e:
             print(f"Error loading annotations for {watch_id}: {e}")
+            return None
+
+        self._annotations_cache[watch_id] = (key, raw, None)
+        return raw
+
+    def _load_cached_annotations(self, watch_id: str) -> dict:
+        """Load annotations for a watch, reusing the last parse if unchanged.
+
+        For read-only lookups: the returned dict is shared with the cache and
+        must not be modified. Use load_annotations() to get an editable copy.
+
+        Args:
+            watch_id: Watch folder name
+
+        Returns:
+            Dictionary of annotations keyed by filename, or empty dict if not found
+        """
+        raw = self._load_raw_annotations(watch_id)
+        if raw is None:
             return {}
 
+        key, _, annotations = self._annotations_cache[watch_id]
+        if annotations is None:
+            try:
+                annotations = json.loads(raw)
+            except json.JSONDecodeError as e:
+                print(f"Error loading annotations for {watch_id}: {e}")
+                return {}
+            self._annotations_cache[watch_id] = (key, raw, annotations)
+        return annotations
+
     def save_annotations(self, watch_id: str, annotations: dict) -> Tuple[bool, str]:
         """Save annotations for a watch.
 
@@ -81,59 +225,93 @@ class AlignmentManager:
             Tuple of (success: bool, error_message: str)
         """
         json_path = self._get_json_path(watch_id)
+        self._annotations_cache.pop(watch_id, None)
 
         try:
-            with open(json_path, 'w') as f:
-                json.dump(annotations, f, indent=2)
+            write_json_atomic(json_path, annotations)
             return True, ""
         except IOError as e:
             error_msg = f"Failed to save annotations: {e}"
             print(error_msg)
             return False, error_msg
 
-    def get_image_annotation(self, watch_id: str, filename: str) -> Optional[dict]:
+    def get_image_annotation(
+        self,
+        watch_id: str,
+        filename: str,
+        annotations: Optional[dict] = None
+    ) -> Optional[dict]:
         """Get annotation for a specific image.
 
         Args:
             watch_id: Watch folder name
             filename: Image filename (will be converted to image ID internally)
+            annotations: Preloaded annotations for the watch, as returned by
+                         load_annotations(). If None, they are read from disk.
 
         Returns:
             Annotation dict if found, None otherwise
         """
+        annotation = self._find_image_annotation(watch_id, filename, annotations)
+        return copy.deepcopy(annotation)
+
+    def _find_image_annotation(
+        self,
+        watch_id: str,
+        filename: str,
+        annotations: Optional[dict] = None
+    ) -> Optional[dict]:
+        """Look up an image's annotation without copying it.
+
+        The returned dict may be shared with the cache and must not be
+        modified.
+        """
         # Convert filename to image ID (quality-agnostic)
         image_id = get_image_id(filename)
         if image_id is None:
             return None
 
-        annotations = self.load_annotations(watch_id)
+        if annotations is None:
+            annotations = self._load_cached_annotations(watch_id)
         return annotations.get(image_id)
 
-    def is_image_labeled(self, watch_id: str, filename: str) -> bool:
+    def is_image_labeled(
+        self,
+        watch_id: str,
+        filename: str,
+        annotations: Optional[dict] = None
+    ) -> bool:
         """Check if an image has a complete annotation (all 5 keypoints).
 
         Args:
             watch_id: Watch folder name
             filename: Image filename
+            annotations: Preloaded annotations for the watch, as returned by
+                         load_annotations(). If None, they are read from disk.
 
         Returns:
             True if all 5 keypoints are present, False otherwise
         """
-        annotation = self.get_image_annotation(watch_id, filename)
+        annotation = self._find_image_annotation(watch_id, filename, annotations)
+        return has_all_keypoints(annotation)
 
-        if not annotation or "coords_norm" not in annotation:
-            return False
+    def list_labeled(self, watch_id: str) -> Set[str]:
+        """Get IDs of all images in a watch with a complete annotation.
 
-        coords = annotation["coords_norm"]
-        required_keys = ["top", "left", "right", "bottom", "center"]
-
-        # Check all 5 keypoints are present and have 2 coordinates each
-        return all(
-            key in coords and
-            isinstance(coords[key], list) and
-            len(coords[key]) == 2
-            for key in required_keys
-        )
+        Reads the watch's JSON file once, so callers checking many images
+        should prefer this over repeated is_image_labeled() calls.
+
+        Args:
+            watch_id: Watch folder name
+
+        Returns:
+            Set of quality-agnostic image IDs (e.g., {"PATEK_nab_041_05"})
+        """
+        annotations = self._load_cached_annotations(watch_id)
+        return {
+            image_id for image_id, annotation in annotations.items()
+            if has_all_keypoints(annotation)
+        }
 
     def save_image_annotation(
         self,
@@ -162,15 +340,14 @@ class AlignmentManager:
             return False, "Invalid filename format"
 
         # Validate coords_pixel has all 5 keypoints
-        required_keys = ["top", "left", "right", "bottom", "center"]
-        if not all(key in coords_pixel for key in required_keys):
+        if not all(key in coords_pixel for key in REQUIRED_KEYPOINTS):
             return False, "Missing required keypoints"
 
         # Normalize coordinates to [0, 1] range
         width, height = image_size
         coords_norm = {}
 
-        for key in required_keys:
+        for key in REQUIRED_KEYPOINTS:
             x_pixel, y_pixel = coords_pixel[key]
             x_norm = x_pixel / width
             y_norm = y_pixel / height
@@ -237,9 +414,12 @@ class AlignmentManager:
         if status_filter == "all":
             return images
 
+        # Load the watch's annotations once instead of once per image
+        labeled_ids = self.list_labeled(watch_id)
+
         filtered = []
         for img in images:
-            is_labeled = self.is_image_labeled(watch_id, img.filename)
+            is_labeled = get_image_id(img.filename) in labeled_ids
 
             if status_filter == "unlabeled" and not is_labeled:
                 filtered.append(img)
@@ -248,27 +428,33 @@ class AlignmentManager:
 
         return filtered
 
-    def get_annotation_count(self, watch_id: str, filename: str) -> int:
+    def get_annotation_count(
+        self,
+        watch_id: str,
+        filename: str,
+        annotations: Optional[dict] = None
+    ) -> int:
         """Get number of keypoints annotated for an image.
 
         Args:
             watch_id: Watch folder name
             filename: Image filename
+            annotations: Preloaded annotations for the watch, as returned by
+                         load_annotations(). If None, they are read from disk.
 
         Returns:
             Number of keypoints (0-5)
         """
-        annotation = self.get_image_annotation(watch_id, filename)
+        annotation = self._find_image_annotation(watch_id, filename, annotations)
 
         if not annotation or "coords_norm" not in annotation:
             return 0
 
         coords = annotation["coords_norm"]
-        required_keys = ["top", "left", "right", "bottom", "center"]
 
         # Count how many keypoints are present
         count = sum(
-            1 for key in required_keys
+            1 for key in REQUIRED_KEYPOINTS
             if key in coords and
                isinstance(coords[key], list) and
                len(coords[key]) == 2
@@ -11,21 +11,88 @@ Examples:
 
 import os
 import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 
-@dataclass
+# Valid view types and quality tags (the "q3" in PATEK_nab_042_04_face_q3.jpg)
+_VIEW_TYPES = ("face", "tiltface")
+_QUALITY_TAGS = {"q1": 1, "q2": 2, "q3": 3}
+
+# Watch ID prefix: everything before the 2-digit view number
+_RE_WATCH_ID = re.compile(r'^(.+?)_\d{2}_')
+
+# BRAND_model_number (works for both filenames and watch IDs)
+_RE_MODEL_ID = re.compile(r'^[A-Z]+_([a-z]+)_\d+')
+
+
+@dataclass(slots=True, frozen=True)
 class ImageMetadata:
-    """Metadata extracted from image filename."""
+    """Metadata extracted from image filename.
+
+    Frozen because ImageManager shares instances between callers through
+    its per-watch cache.
+    """
     watch_id: str          # e.g., "PATEK_nab_042"
     view_number: str       # e.g., "04" (keep as string to preserve leading zero)
-    view_type: str         # "face" or "tiltface"
+    view_type: str         # "face" or "tiltface" (interned)
     quality: Optional[int] # 1, 2, 3, or None
-    filename: str          # Original filename
     full_path: str         # Full path to the file
     model_identifier: Optional[str] = None  # e.g., "nab", "nam" - extracted from watch_id
 
+    @property
+    def filename(self) -> str:
+        """Original filename (derived from full_path)."""
+        return os.path.basename(self.full_path)
+
+
+def _looks_like_image_name(filename: str) -> bool:
+    """Cheap pre-filter for names that could possibly be tagged images.
+
+    Every valid name ends in .jpg and has at least two underscores
+    ({watch_id}_{NN}_{view_type}), so anything else is rejected without
+    further parsing.
+    """
+    return filename.endswith('.jpg') and filename.count('_') >= 2
+
+
+def _split_filename(filename: str) -> Optional[Tuple[str, str, str, Optional[int]]]:
+    """Split a tagged or legacy filename into its components.
+
+    Equivalent to matching ^(.+?)_(\\d{2})_(face|tiltface)(_q[123])?\\.jpg$,
+    but done with str.rsplit since the grammar is fixed from the right.
+
+    Args:
+        filename: Image filename (no directory)
+
+    Returns:
+        Tuple of (watch_id, view_number, view_type, quality), or None if
+        the filename doesn't match the expected format
+    """
+    if not _looks_like_image_name(filename):
+        return None
+
+    stem = filename[:-4]
+    quality = _QUALITY_TAGS.get(stem[-2:]) if stem[-3:-2] == '_' else None
+
+    if quality is not None:
+        # Tagged: PATEK_nab_042_04_face_q3.jpg
+        stem = stem[:-3]
+
+    # Legacy (or tagged with the quality stripped): PATEK_nab_042_04_face
+    parts = stem.rsplit('_', 2)
+    if len(parts) != 3:
+        return None
+
+    watch_id, view_number, view_type = parts
+    if (not watch_id or
+            len(view_number) != 2 or not view_number.isdecimal() or
+            view_type not in _VIEW_TYPES):
+        return None
+
+    return watch_id, view_number, view_type, quality
+
 
 def parse_filename(filepath: str) -> Optional[ImageMetadata]:
     """Parse filename to extract metadata.
@@ -38,39 +105,44 @@ def parse_filename(filepath: str) -> Optional[ImageMetadata]:
     """
     filename = os.path.basename(filepath)
 
-    # Pattern with quality tag: PATEK_nab_042_04_face_q3.jpg
-    pattern_tagged = r'^(.+?)_(\d{2})_(face|tiltface)_q([123])\.jpg$'
-    match = re.match(pattern_tagged, filename)
+    parts = _split_filename(filename)
+    if parts is None:
+        return None  # Malformed filename
+
+    watch_id, view_number, view_type, quality = parts
+    return ImageMetadata(
+        watch_id=watch_id,
+        view_number=view_number,
+        view_type=sys.intern(view_type),
+        quality=quality,
+        full_path=filepath,
+        model_identifier=extract_model_identifier(watch_id)
+    )
+
+
+def build_filename(
+    watch_id: str,
+    view_number: str,
+    view_type: str,
+    quality: Optional[int]
+) -> str:
+    """Build a tagged filename from its parts.
 
-    if match:
-        watch_id = match.group(1)
-        return ImageMetadata(
-            watch_id=watch_id,
-            view_number=match.group(2),
-            view_type=match.group(3),
-            quality=int(match.group(4)),
-            filename=filename,
-            full_path=filepath,
-            model_identifier=extract_model_identifier(watch_id)
-        )
-
-    # Pattern without quality tag (legacy): PATEK_nab_042_04_face.jpg
-    pattern_legacy = r'^(.+?)_(\d{2})_(face|tiltface)\.jpg$'
-    match = re.match(pattern_legacy, filename)
+    Args:
+        watch_id: Watch ID (e.g., "PATEK_nab_042")
+        view_number: 2-digit view number (e.g., "04")
+        view_type: "face" or "tiltface"
+        quality: 1, 2, 3, or None
 
-    if match:
-        watch_id = match.group(1)
-        return ImageMetadata(
-            watch_id=watch_id,
-            view_number=match.group(2),
-            view_type=match.group(3),
-            quality=None,
-            filename=filename,
-            full_path=filepath,
-            model_identifier=extract_model_identifier(watch_id)
-        )
+    Returns:
+        Filename string with tags
+    """
+    base = f"{watch_id}_{view_number}_{view_type}"
 
-    return None  # Malformed filename
+    if quality is not None:
+        return f"{base}_q{quality}.jpg"
+    else:
+        return f"{base}.jpg"
 
 
 def generate_filename(metadata: ImageMetadata) -> str:
@@ -82,12 +154,9 @@ def generate_filename(metadata: ImageMetadata) -> str:
     Returns:
         Filename string with tags
     """
-    base = f"{metadata.watch_id}_{metadata.view_number}_{metadata.view_type}"
-
-    if metadata.quality is not None:
-        return f"{base}_q{metadata.quality}.jpg"
-    else:
-        return f"{base}.jpg"
+    return build_filename(
+        metadata.watch_id, metadata.view_number, metadata.view_type, metadata.quality
+    )
 
 
 def extract_watch_id(filename: str) -> Optional[str]:
@@ -99,8 +168,7 @@ def extract_watch_id(filename: str) -> Optional[str]:
     Returns:
         Watch ID if found, None otherwise
     """
-    pattern = r'^(.+?)_\d{2}_'
-    match = re.match(pattern, filename)
+    match = _RE_WATCH_ID.match(filename)
     return match.group(1) if match else None
 
 
@@ -123,10 +191,8 @@ def extract_model_identifier(filename: str) -> Optional[str]:
         >>> extract_model_identifier("PATEK_nab_042")
         "nab"
     """
-    # Pattern: BRAND_model_number (works for both filenames and watch IDs)
     # Captures the model identifier (letters between first and second underscore)
-    pattern = r'^[A-Z]+_([a-z]+)_\d+'
-    match = re.match(pattern, filename)
+    match = _RE_MODEL_ID.match(filename)
 
     if match:
         return match.group(1)
@@ -152,19 +218,9 @@ def get_image_id(filename: str) -> Optional[str]:
         >>> get_image_id("PATEK_nab_041_05_face.jpg")
         "PATEK_nab_041_05"
     """
-    # Pattern with quality tag: PATEK_nab_042_04_face_q3.jpg
-    pattern_tagged = r'^(.+?)_(\d{2})_(face|tiltface)_q[123]\.jpg$'
-    match = re.match(pattern_tagged, filename)
-
-    if match:
-        # Return watch_id + view_number (e.g., "PATEK_nab_041_05")
-        return f"{match.group(1)}_{match.group(2)}"
-
-    # Pattern without quality tag (legacy): PATEK_nab_042_04_face.jpg
-    pattern_legacy = r'^(.+?)_(\d{2})_(face|tiltface)\.jpg$'
-    match = re.match(pattern_legacy, filename)
-
-    if match:
-        return f"{match.group(1)}_{match.group(2)}"
+    parts = _split_filename(filename)
+    if parts is None:
+        return None  # Malformed filename
 
-    return None  # Malformed filename
+    # Return watch_id + view_number (e.g., "PATEK_nab_041_05")
+    return f"{parts[0]}_{parts[1]}"
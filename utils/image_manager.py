@@ -4,15 +4,83 @@ Handles loading watch folders, images, file operations (rename, delete),
 and navigation between watches.
 """
 
+import errno
 import os
 import shutil
-from typing import List, Optional, Tuple
+import time
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 try:
-    from .filename_parser import ImageMetadata, parse_filename, generate_filename
+    from .filename_parser import ImageMetadata, build_filename, parse_filename
 except ImportError:
-    from filename_parser import ImageMetadata, parse_filename, generate_filename
+    from filename_parser import ImageMetadata, build_filename, parse_filename
+
+
+# A folder listing is only cached once the folder's mtime is at least this
+# old. Timestamps can be coarse (1-2 s on SMB/FAT), so a file added in the
+# same tick as the scan may not change the mtime we compare against later.
+_RACY_WINDOW_NS = 1_000_000_000
+
+
+def _move_file(source: str, dest: str) -> None:
+    """Move a file, replacing dest if it exists.
+
+    Uses a single os.replace when source and dest are on the same filesystem
+    (the usual case, since .trash lives inside images_dir) and only falls
+    back to shutil.move's copy-and-delete across devices.
+
+    Args:
+        source: Path of the file to move
+        dest: Destination file path
+
+    Raises:
+        OSError: If the file cannot be moved
+    """
+    try:
+        os.replace(source, dest)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, dest)
+
+
+def _move_file_no_replace(source: str, dest: str) -> None:
+    """Move a file, failing if dest already exists.
+
+    Hard-links dest to source and then unlinks source. os.link refuses to
+    overwrite, so the existence check and the move are a single atomic step
+    with no separate stat. Filesystems without hard-link support (or moves
+    across devices) fall back to an explicit check followed by _move_file.
+
+    Args:
+        source: Path of the file to move
+        dest: Destination file path
+
+    Raises:
+        FileNotFoundError: If source does not exist
+        FileExistsError: If dest already exists
+        OSError: If the file cannot be moved
+    """
+    try:
+        os.link(source, dest)
+    except (FileNotFoundError, FileExistsError):
+        raise
+    except OSError:
+        if os.path.lexists(dest):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), dest)
+        _move_file(source, dest)
+        return
+
+    try:
+        os.unlink(source)
+    except OSError:
+        # Don't leave the file under both names
+        try:
+            os.unlink(dest)
+        except OSError:
+            pass
+        raise
 
 
 class ImageManager:
@@ -35,21 +103,24 @@ class ImageManager:
         self.current_watch_index: int = 0
         self.current_images: List[ImageMetadata] = []
 
+        # Parsed images per watch, keyed by watch_id: (folder mtime_ns, images)
+        self._image_cache: Dict[str, Tuple[int, List[ImageMetadata]]] = {}
+
     def load_watches(self) -> List[str]:
         """Scan downloaded_images for watch folders.
 
         Returns:
             Sorted list of watch folder names
         """
-        if not os.path.exists(self.images_dir):
-            return []
-
         # Get all directories, excluding .trash
-        watches = []
-        for item in os.listdir(self.images_dir):
-            item_path = os.path.join(self.images_dir, item)
-            if os.path.isdir(item_path) and not item.startswith('.'):
-                watches.append(item)
+        try:
+            with os.scandir(self.images_dir) as entries:
+                watches = [
+                    entry.name for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()
+                ]
+        except FileNotFoundError:
+            return []
 
         # Sort alphabetically
         watches.sort()
@@ -64,29 +135,64 @@ class ImageManager:
 
         Returns:
             List of ImageMetadata for images in the watch folder
+
+        Parsed results are cached per watch and reused while the folder's
+        mtime is unchanged (any add, rename or delete inside it bumps it).
+        Folders changed within the last second are rescanned every time.
         """
         if watch_id is None:
             if not self.watches or self.current_watch_index >= len(self.watches):
                 return []
             watch_id = self.watches[self.current_watch_index]
 
-        watch_path = os.path.join(self.images_dir, watch_id)
-        if not os.path.exists(watch_path):
+        cached_images = self._load_watch_images(watch_id)
+        if cached_images is None:
             return []
 
+        images = list(cached_images)
+        self.current_images = images
+        return images
+
+    def _load_watch_images(self, watch_id: str) -> Optional[List[ImageMetadata]]:
+        """Load images for a watch through the per-watch mtime cache.
+
+        Args:
+            watch_id: Watch folder name
+
+        Returns:
+            Cached list of ImageMetadata sorted by view number (the list is
+            shared, do not modify it), or None if the watch folder doesn't exist
+        """
+        watch_path = os.path.join(self.images_dir, watch_id)
+        try:
+            mtime = os.stat(watch_path).st_mtime_ns
+        except FileNotFoundError:
+            self._image_cache.pop(watch_id, None)
+            return None
+
+        cached = self._image_cache.get(watch_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         images = []
-        for filename in os.listdir(watch_path):
-            if not filename.endswith('.jpg'):
-                continue
+        with os.scandir(watch_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.jpg') or not entry.is_file():
+                    continue
 
-            filepath = os.path.join(watch_path, filename)
-            metadata = parse_filename(filepath)
-            if metadata:
-                images.append(metadata)
+                metadata = parse_filename(entry.path)
+                if metadata:
+                    images.append(metadata)
 
         # Sort by view number
         images.sort(key=lambda x: x.view_number)
-        self.current_images = images
+
+        # Don't trust an mtime this close to the scan: a change in the same
+        # timestamp tick would leave it unchanged (git's "racy clean" rule)
+        if time.time_ns() - mtime >= _RACY_WINDOW_NS:
+            self._image_cache[watch_id] = (mtime, images)
+        else:
+            self._image_cache.pop(watch_id, None)
         return images
 
     def rename_image(self, image_meta: ImageMetadata, new_view_type: str, new_quality: Optional[int]) -> Tuple[bool, str]:
@@ -102,38 +208,29 @@ class ImageManager:
         """
         old_path = image_meta.full_path
 
-        if not os.path.exists(old_path):
-            return False, f"File not found: {old_path}"
-
-        # Create new metadata
-        new_meta = ImageMetadata(
-            watch_id=image_meta.watch_id,
-            view_number=image_meta.view_number,
-            view_type=new_view_type,
-            quality=new_quality,
-            filename="",  # Will be generated
-            full_path=""
-        )
-
         # Generate new filename
-        new_filename = generate_filename(new_meta)
+        new_filename = build_filename(
+            image_meta.watch_id, image_meta.view_number, new_view_type, new_quality
+        )
         new_path = os.path.join(os.path.dirname(old_path), new_filename)
 
         # Check if file already exists (same name)
         if old_path == new_path:
             return True, "No change needed"
 
-        # Check if target file already exists
-        if os.path.exists(new_path):
-            return False, f"Target file already exists: {new_filename}"
-
-        # Rename file
+        # Rename file (fails instead of overwriting an existing target)
         try:
-            os.rename(old_path, new_path)
-            return True, f"Renamed to {new_filename}"
+            _move_file_no_replace(old_path, new_path)
+        except FileNotFoundError:
+            return False, f"File not found: {old_path}"
+        except FileExistsError:
+            return False, f"Target file already exists: {new_filename}"
         except OSError as e:
             return False, f"Failed to rename: {e}"
 
+        self._image_cache.pop(image_meta.watch_id, None)
+        return True, f"Renamed to {new_filename}"
+
     def delete_image(self, image_meta: ImageMetadata) -> Tuple[bool, str]:
         """Move image to .trash folder.
 
@@ -145,29 +242,32 @@ class ImageManager:
         """
         source = image_meta.full_path
 
-        if not os.path.exists(source):
-            return False, f"File not found: {source}"
-
         # Create trash directory structure
         trash_watch_dir = os.path.join(self.trash_dir, image_meta.watch_id)
         os.makedirs(trash_watch_dir, exist_ok=True)
 
-        # Move file
-        dest = os.path.join(trash_watch_dir, image_meta.filename)
-
-        # If dest already exists, add a number suffix
-        if os.path.exists(dest):
-            base, ext = os.path.splitext(image_meta.filename)
-            counter = 1
-            while os.path.exists(dest):
-                dest = os.path.join(trash_watch_dir, f"{base}_{counter}{ext}")
+        # Move file, adding a number suffix if the name is already taken.
+        # _move_file_no_replace refuses to overwrite, so a taken name just
+        # moves on to the next candidate.
+        base, ext = os.path.splitext(image_meta.filename)
+        candidate = image_meta.filename
+        counter = 0
+
+        while True:
+            dest = os.path.join(trash_watch_dir, candidate)
+            try:
+                _move_file_no_replace(source, dest)
+                break
+            except FileExistsError:
                 counter += 1
+                candidate = f"{base}_{counter}{ext}"
+            except FileNotFoundError:
+                return False, f"File not found: {source}"
+            except OSError as e:
+                return False, f"Failed to delete: {e}"
 
-        try:
-            shutil.move(source, dest)
-            return True, f"Moved to trash: {image_meta.filename}"
-        except OSError as e:
-            return False, f"Failed to delete: {e}"
+        self._image_cache.pop(image_meta.watch_id, None)
+        return True, f"Moved to trash: {image_meta.filename}"
 
     def next_watch(self) -> Optional[str]:
         """Navigate to next watch.
@@ -241,34 +341,44 @@ class ImageManager:
         """
         trash_images = {}
 
-        if not os.path.exists(self.trash_dir):
+        try:
+            with os.scandir(self.trash_dir) as watch_entries:
+                watch_dirs = [entry for entry in watch_entries if entry.is_dir()]
+        except FileNotFoundError:
             return trash_images
 
-        for watch_id in os.listdir(self.trash_dir):
-            trash_watch_dir = os.path.join(self.trash_dir, watch_id)
+        for watch_entry in watch_dirs:
+            images = self._load_trash_watch(watch_entry.path)
+            if images:
+                trash_images[watch_entry.name] = images
 
-            if not os.path.isdir(trash_watch_dir):
-                continue
+        return trash_images
+
+    def _load_trash_watch(self, trash_watch_dir: str) -> List[Tuple[ImageMetadata, float]]:
+        """Load deleted images from a single watch folder in trash.
+
+        Args:
+            trash_watch_dir: Path to the watch's folder inside .trash
 
-            images = []
-            for filename in os.listdir(trash_watch_dir):
-                if not filename.endswith('.jpg'):
+        Returns:
+            List of (ImageMetadata, deleted_time) tuples, most recent first
+        """
+        images = []
+        with os.scandir(trash_watch_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.jpg') or not entry.is_file():
                     continue
 
-                filepath = os.path.join(trash_watch_dir, filename)
-                metadata = parse_filename(filepath)
+                metadata = parse_filename(entry.path)
 
                 if metadata:
                     # Get file modification time (when it was deleted)
-                    deleted_time = os.path.getmtime(filepath)
+                    deleted_time = entry.stat().st_mtime
                     images.append((metadata, deleted_time))
 
-            if images:
-                # Sort by deletion time, most recent first
-                images.sort(key=lambda x: x[1], reverse=True)
-                trash_images[watch_id] = images
-
-        return trash_images
+        # Sort by deletion time, most recent first
+        images.sort(key=lambda x: x[1], reverse=True)
+        return images
 
     def restore_image(self, image_meta: ImageMetadata) -> Tuple[bool, str]:
         """Restore a deleted image from trash back to its original location.
@@ -281,22 +391,22 @@ class ImageManager:
         """
         trash_path = image_meta.full_path
 
-        if not os.path.exists(trash_path):
-            return False, f"File not found in trash: {trash_path}"
-
         # Determine original location
         watch_dir = os.path.join(self.images_dir, image_meta.watch_id)
         dest_path = os.path.join(watch_dir, image_meta.filename)
 
-        # Check if destination already exists
-        if os.path.exists(dest_path):
-            return False, f"File already exists at destination: {image_meta.filename}"
-
         # Ensure watch directory exists
         os.makedirs(watch_dir, exist_ok=True)
 
+        # Move back (fails instead of overwriting an existing file)
         try:
-            shutil.move(trash_path, dest_path)
-            return True, f"Restored: {image_meta.filename}"
+            _move_file_no_replace(trash_path, dest_path)
+        except FileNotFoundError:
+            return False, f"File not found in trash: {trash_path}"
+        except FileExistsError:
+            return False, f"File already exists at destination: {image_meta.filename}"
         except OSError as e:
             return False, f"Failed to restore: {e}"
+
+        self._image_cache.pop(image_meta.watch_id, None)
+        return True, f"Restored: {image_meta.filename}"
@@ -5,12 +5,18 @@ Template annotations are stored in templates/{template_name}/annotations.json
 with the same normalized coordinate format as image annotations.
 """
 
+import copy
 import os
 import json
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    from .alignment_manager import REQUIRED_KEYPOINTS, has_all_keypoints, write_json_atomic
+except ImportError:
+    from alignment_manager import REQUIRED_KEYPOINTS, has_all_keypoints, write_json_atomic
+
 
 class TemplateManager:
     """Manages template annotations for watch templates."""
@@ -29,6 +35,10 @@ class TemplateManager:
 
         self.templates_dir = templates_dir
 
+        # Parsed annotations per template, keyed by name:
+        # ((mtime_ns, size, inode), annotation)
+        self._annotations_cache: Dict[str, Tuple[Tuple[int, int, int], dict]] = {}
+
     def get_template_path(self, template_name: str) -> str:
         """Get path to template image file.
 
@@ -74,17 +84,29 @@ class TemplateManager:
         """
         json_path = self._get_annotations_path(template_name)
 
-        if not os.path.exists(json_path):
-            return None
-
         try:
-            with open(json_path, 'r') as f:
-                annotation = json.load(f)
-            return annotation
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Error loading template annotations for {template_name}: {e}")
+            st = os.stat(json_path)
+        except OSError:
+            self._annotations_cache.pop(template_name, None)
             return None
 
+        # Size and inode catch rewrites within one coarse mtime tick
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._annotations_cache.get(template_name)
+        if cached is not None and cached[0] == key:
+            annotation = cached[1]
+        else:
+            try:
+                with open(json_path, 'r') as f:
+                    annotation = json.load(f)
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Error loading template annotations for {template_name}: {e}")
+                return None
+            self._annotations_cache[template_name] = (key, annotation)
+
+        # Hand out a copy so callers can't modify the cached entry
+        return copy.deepcopy(annotation)
+
     def save_template_annotations(
         self,
         template_name: str,
@@ -105,15 +127,14 @@ class TemplateManager:
             Tuple of (success: bool, error_message: str)
         """
         # Validate coords_pixel has all 5 keypoints
-        required_keys = ["top", "left", "right", "bottom", "center"]
-        if not all(key in coords_pixel for key in required_keys):
+        if not all(key in coords_pixel for key in REQUIRED_KEYPOINTS):
             return False, "Missing required keypoints"
 
         # Normalize coordinates to [0, 1] range
         width, height = image_size
         coords_norm = {}
 
-        for key in required_keys:
+        for key in REQUIRED_KEYPOINTS:
             x_pixel, y_pixel = coords_pixel[key]
             x_norm = x_pixel / width
             y_norm = y_pixel / height
@@ -133,9 +154,9 @@ class TemplateManager:
 
         # Save
         json_path = self._get_annotations_path(template_name)
+        self._annotations_cache.pop(template_name, None)
         try:
-            with open(json_path, 'w') as f:
-                json.dump(annotation, f, indent=2)
+            write_json_atomic(json_path, annotation)
             return True, ""
         except IOError as e:
             error_msg = f"Failed to save template annotations: {e}"
@@ -151,20 +172,7 @@ class TemplateManager:
         Returns:
             True if all 5 keypoints are present, False otherwise
         """
-        annotation = self.load_template_annotations(template_name)
-
-        if not annotation or "coords_norm" not in annotation:
-            return False
-
-        coords = annotation["coords_norm"]
-        required_keys = ["top", "left", "right", "bottom", "center"]
-
-        return all(
-            key in coords and
-            isinstance(coords[key], list) and
-            len(coords[key]) == 2
-            for key in required_keys
-        )
+        return has_all_keypoints(self.load_template_annotations(template_name))
 
     def clear_template_annotations(self, template_name: str) -> Tuple[bool, str]:
         """Clear annotations for a template.
@@ -176,6 +184,7 @@ class TemplateManager:
             Tuple of (success: bool, error_message: str)
         """
         json_path = self._get_annotations_path(template_name)
+        self._annotations_cache.pop(template_name, None)
 
         if os.path.exists(json_path):
             try: